@@ -0,0 +1,340 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tune ResNet-50 for CUDA with MetaSchedule through both the Relay and
+the Relax compilation paths, then benchmark the tuned modules."""
+
+import os
+
+import numpy as np
+
+import tvm
+from tvm import meta_schedule as ms
+from tvm import relax, relay
+from tvm.contrib import graph_executor
+from tvm.contrib.cuda_graph import cuda_graph_executor
+from tvm.meta_schedule import postproc, schedule_rule
+from tvm.meta_schedule.database import JSONDatabase
+from tvm.relax.testing import nn, relay_translator
+from tvm.relay import testing
+from tvm.target import Target
+
+# importing the intrinsic also registers the wmma_* tensor intrinsics
+from tvm.tir.tensor_intrin.cuda import WMMA_SYNC_16x16x16_f16f16f16_INTRIN
+
+network = "resnet-50"
+batch_size = 1
+# NHWC + FP16 is what enables the V100 tensor-core (WMMA) kernels;
+# NCHW/FP32 stays on the plain FP32 CUDA cores.
+layout = "NHWC"
+dtype = "float16"
+image_shape = (224, 224, 3)
+input_shape = (batch_size, *image_shape)
+input_name = "data"
+target = Target("nvidia/nvidia-v100")
+dev = tvm.cuda()
+num_trials = 20000
+times = 1000
+log_dir = "resnet_autotir_logs"
+
+
+# Tensor-core search space for the V100: tile the dominant conv2d/gemm
+# blocks onto the wmma_sync_16x16x16_f16f16f16 intrinsic instead of the
+# plain FP32 SIMT schedules the default CUDA rules emit. Blocks that
+# cannot map onto the intrinsic (the 3-channel stem conv, the 1000-unit
+# classifier dense, pooling, softmax) are tiled as plain multi-level
+# tiling by the same rule, so one rule set serves the whole network.
+sch_rules_tensorcore = [
+    schedule_rule.MultiLevelTilingWithIntrin(
+        WMMA_SYNC_16x16x16_f16f16f16_INTRIN,
+        structure="SSSRRSRS",
+        tile_binds=["blockIdx.x", "vthread.x", "threadIdx.x"],
+        max_innermost_factor=64,
+        vector_load_lens=[1, 2, 3, 4],
+        reuse_read=schedule_rule.ReuseType(
+            req="must",
+            levels=[4],
+            scope="shared",
+        ),
+        reuse_write=schedule_rule.ReuseType(
+            req="must",
+            levels=[3],
+            scope="local",
+        ),
+    ),
+    schedule_rule.AutoInline(
+        into_producer=True,
+        into_consumer=True,
+        inline_const_tensor=True,
+        disallow_if_then_else=False,
+        require_injective=False,
+        require_ordered=False,
+        disallow_op=None,
+    ),
+    schedule_rule.CrossThreadReduction(thread_extents=[4, 8, 16, 32, 64, 128, 256, 512]),
+    schedule_rule.ParallelizeVectorizeUnroll(
+        max_jobs_per_core=-1,  # disable parallelize
+        max_vectorize_extent=-1,  # disable vectorize
+        # extra candidates {32, 128, 256} over the CUDA defaults; the
+        # intermediate unroll depths help the SM70 conv kernels. This is
+        # the one rule set every task is tuned with, so the widened
+        # candidates apply to the non-tensor-core tasks as well
+        unroll_max_steps=[0, 16, 32, 64, 128, 256, 512, 1024],
+        unroll_explicit=True,
+    ),
+    schedule_rule.AutoBind(
+        max_threadblocks=256,
+        thread_extents=[32, 64, 128, 256, 512, 1024],
+    ),
+]
+
+postprocs_tensorcore = [
+    postproc.DisallowDynamicLoop(),
+    postproc.RewriteCooperativeFetch(),
+    postproc.RewriteUnboundBlock(),
+    postproc.RewriteParallelVectorizeUnroll(),
+    postproc.RewriteReductionBlock(),
+    postproc.RewriteTensorize(),
+    postproc.VerifyGPUCode(),
+]
+
+
+def get_resnet(batch_size, layout, image_shape):
+    relay_mod, params = testing.resnet.get_workload(
+        num_layers=50,
+        batch_size=batch_size,
+        dtype="float32",
+        layout=layout,
+        image_shape=image_shape,
+    )
+    # Rewrite convolutions and pooling for NHWC kernel layouts and cast the
+    # network to mixed FP16 so that tensor-core schedules can match.
+    with tvm.transform.PassContext(opt_level=3):
+        relay_mod = relay.transform.ConvertLayout(
+            {
+                "nn.conv2d": ["NHWC", "default"],
+                "nn.max_pool2d": ["NHWC"],
+                "nn.global_avg_pool2d": ["NHWC"],
+            }
+        )(relay_mod)
+        relay_mod = relay.transform.ToMixedPrecision(dtype)(relay_mod)
+    return relay_mod, params
+
+
+def create_database(workload_file, tuning_record_file):
+    os.makedirs(os.path.dirname(workload_file), exist_ok=True)
+    database = JSONDatabase(
+        path_workload=workload_file,
+        path_tuning_record=tuning_record_file,
+    )
+    return database
+
+
+def get_builder():
+    # NVCC builds dominate the tuning wall clock with this many trials;
+    # compile trial candidates in parallel across every core while the
+    # LocalRunner keeps the GPU measurements single-stream
+    return ms.builder.LocalBuilder(max_workers=os.cpu_count())
+
+
+def get_runner():
+    # allocate each trial's buffers once (alloc_repeat=1) and measure with
+    # the C++-side evaluator, so per-trial runner overhead stays out of
+    # both the measurements and the tuning wall clock
+    return ms.runner.LocalRunner(
+        evaluator_config=ms.runner.EvaluatorConfig(
+            number=3,
+            repeat=1,
+            min_repeat_ms=100,
+            enable_cpu_cache_flush=False,
+        ),
+        alloc_repeat=1,
+    )
+
+
+def tune_config():
+    return ms.TuneConfig(
+        strategy="evolutionary",
+        num_trials_per_iter=64,
+        max_trials_per_task=num_trials,
+        max_trials_global=num_trials,
+    )
+
+
+if __name__ == "__main__":
+    # the workload and its Relax translation are deterministic, so both
+    # modules (and the weights) are cached on disk after the first run
+    os.makedirs(log_dir, exist_ok=True)
+    relay_mod_path = f"{log_dir}/relay_mod_{layout}_{dtype}.json"
+    relax_mod_path = f"{log_dir}/relax_mod_{layout}_{dtype}.json"
+    params_path = f"{log_dir}/params_{layout}_{dtype}.params"
+    if all(os.path.exists(path) for path in (relay_mod_path, relax_mod_path, params_path)):
+        with open(relay_mod_path) as f:
+            relay_mod = tvm.ir.load_json(f.read())
+        with open(relax_mod_path) as f:
+            relax_mod = tvm.ir.load_json(f.read())
+        with open(params_path, "rb") as f:
+            params = tvm.runtime.load_param_dict(f.read())
+    else:
+        relay_mod, params = get_resnet(batch_size, layout, image_shape)
+
+        # translate the ResNet model from Relay to Relax; the weights stay
+        # function parameters so that both paths run the same workload
+        relax_mod = relay_translator.from_relay(relay_mod["main"], target)
+
+        with open(relay_mod_path, "w") as f:
+            f.write(tvm.ir.save_json(relay_mod))
+        with open(relax_mod_path, "w") as f:
+            f.write(tvm.ir.save_json(relax_mod))
+        with open(params_path, "wb") as f:
+            f.write(tvm.runtime.save_param_dict(params))
+
+    # fill a pre-allocated device buffer in place instead of allocating a
+    # fresh NDArray per host array; a seeded PCG64 generator is both
+    # reproducible and markedly faster than legacy np.random.rand.
+    # ToMixedPrecision only inserts casts at op boundaries and leaves the
+    # graph inputs in float32, so the input buffer stays float32 no matter
+    # what `dtype` the network computes in
+    data = tvm.nd.empty(input_shape, "float32", dev)
+    data.copyfrom(np.random.default_rng(0).random(input_shape, dtype="float32"))
+
+    relay_log_dir = f"{log_dir}/{network}-{layout}-{dtype}-relay"
+    relax_log_dir = f"{log_dir}/{network}-{layout}-{dtype}-relax"
+
+    # one XGBoost cost model shared by both tuning phases, so the Relax
+    # phase starts from a model already fitted on the Relay measurements
+    # instead of training from scratch; tune_* checkpoints it to
+    # <work_dir>/cost_model.xgb, letting re-runs resume it as well
+    cost_model = ms.cost_model.XGBModel(extractor=ms.feature_extractor.PerStoreFeature())
+    for path in (f"{relax_log_dir}/cost_model.xgb", f"{relay_log_dir}/cost_model.xgb"):
+        if os.path.exists(path):
+            cost_model.load(path)
+            break
+
+    # tune and benchmark the Relay path; the database paths are keyed on
+    # layout/dtype so FP16 logs do not collide with FP32 ones.
+    # JSONDatabase creates tuning_record.json on construction, so its mere
+    # existence does not mean tuning ran to completion; the marker file is
+    # written only once tune_relay returns
+    relay_tuned_marker = f"{relay_log_dir}/tuned"
+    relay_tuned = os.path.exists(relay_tuned_marker)
+    relay_database = create_database(
+        f"{relay_log_dir}/workload.json", f"{relay_log_dir}/tuning_record.json"
+    )
+    relay_lib_path = f"{relay_log_dir}/lib.so"
+    if relay_tuned and os.path.exists(relay_lib_path):
+        # codegen for a tuned ResNet-50 takes tens of seconds; reuse the
+        # library exported by an earlier run alongside the tuning logs
+        relay_ex = tvm.runtime.load_module(relay_lib_path)
+    else:
+        if not relay_tuned:
+            relay_ex = ms.tune_relay(
+                mod=relay_mod,
+                params=params,
+                target=target,
+                config=tune_config(),
+                work_dir=relay_log_dir,
+                database=relay_database,
+                builder=get_builder(),
+                runner=get_runner(),
+                cost_model=cost_model,
+                sch_rules=lambda: sch_rules_tensorcore,
+                postprocs=lambda: postprocs_tensorcore,
+            )
+            open(relay_tuned_marker, "w").close()
+        else:
+            # tuning already completed; apply the records instead of tuning again
+            with target, ms.ApplyHistoryBest(relay_database):
+                with tvm.transform.PassContext(
+                    opt_level=3,
+                    config={"relay.backend.use_meta_schedule": True},
+                ):
+                    relay_ex = relay.build(relay_mod, target=target, params=params)
+        relay_ex.export_library(relay_lib_path)
+
+    module = graph_executor.GraphModule(relay_ex["default"](dev))
+    # bind the device buffer as the executor's input storage outright, so
+    # refilling `data` in place needs no further copy into the executor
+    module.module["set_input_zero_copy"](input_name, data)
+    module.run()  # warm up
+    # time on the C++ side: the evaluator synchronizes the device between
+    # iterations, so the numbers are not skewed by Python dispatch overhead
+    evaluator = module.module.time_evaluator("run", dev, number=times, repeat=3, min_repeat_ms=100)
+    print(f"relay: {evaluator().mean * 1000:.3f} ms/iter")
+
+    # replay the whole launch sequence as a single captured CUDA graph; at
+    # batch size 1 the kernels are short and per-launch overhead is a large
+    # part of the critical path (needs USE_GRAPH_EXECUTOR_CUGRAPH=ON)
+    if target.kind.name == "cuda" and tvm.get_global_func(
+        "tvm.graph_executor_cuda_graph.create", allow_missing=True
+    ):
+        cugraph_module = cuda_graph_executor.GraphModuleCudaGraph(
+            relay_ex["cuda_graph_create"](dev)
+        )
+        cugraph_module.set_input(input_name, data)
+        cugraph_module.capture_cuda_graph()
+        evaluator = cugraph_module.module.time_evaluator(
+            "run_cuda_graph", dev, number=times, repeat=3
+        )
+        print(f"relay (cuda graph): {evaluator().mean * 1000:.3f} ms/iter")
+
+    # tune and benchmark the Relax path; same completion marker scheme as
+    # the Relay phase above
+    relax_tuned_marker = f"{relax_log_dir}/tuned"
+    relax_tuned = os.path.exists(relax_tuned_marker)
+    relax_database = create_database(
+        f"{relax_log_dir}/workload.json", f"{relax_log_dir}/tuning_record.json"
+    )
+    relax_lib_path = f"{relax_log_dir}/lib.so"
+    if relax_tuned and os.path.exists(relax_lib_path):
+        # the VM accepts the loaded runtime module directly
+        relax_ex = tvm.runtime.load_module(relax_lib_path)
+    else:
+        if not relax_tuned:
+            relax_ex = ms.tune_relax(
+                mod=relax_mod,
+                target=target,
+                config=tune_config(),
+                work_dir=relax_log_dir,
+                database=relax_database,
+                builder=get_builder(),
+                runner=get_runner(),
+                cost_model=cost_model,
+                sch_rules=lambda: sch_rules_tensorcore,
+                postprocs=lambda: postprocs_tensorcore,
+            )
+            open(relax_tuned_marker, "w").close()
+        else:
+            with tvm.transform.PassContext(opt_level=3):
+                relax_mod = relax.transform.MetaScheduleApplyHistoryBest(relax_database, target)(
+                    relax_mod
+                )
+                relax_ex = relax.vm.build(relax_mod, target)
+        relax_ex.mod.export_library(relax_lib_path)
+
+    # the pooled allocator grows once during warm-up and then serves the
+    # per-op intermediate tensors from the pool, keeping cudaMalloc/cudaFree
+    # out of the steady-state inference loop
+    relax_vm = relax.VirtualMachine(relax_ex, dev, memory_cfg="pooled")
+    params = nn.init_params(relax_mod)
+    # set_input copies the input and the ~160 weight tensors to the device
+    # and stores them on the VM once; the stateful zero-argument entry
+    # point then reuses them, so no argument marshalling (or host-side
+    # tensor) is left anywhere in the timed path
+    relax_vm.set_input("main", data, *params)
+    relax_vm.module["main"]()  # warm up
+    evaluator = relax_vm.module.time_evaluator("main", dev, number=times, repeat=3)
+    print(f"relax: {evaluator().mean * 1000:.3f} ms/iter")
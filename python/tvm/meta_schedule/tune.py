@@ -20,7 +20,7 @@ import logging
 import logging.config
 import os
 from os import path as osp
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Union
 
 from tvm.ir import IRModule
 from tvm.ir.transform import PassContext
@@ -244,6 +244,7 @@ def tune_extracted_tasks(
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
+    special_space: Optional[Mapping[str, FnSpaceGenerator]] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
@@ -273,6 +274,9 @@ def tune_extracted_tasks(
         The task scheduler to use.
     space : Optional[FnSpaceGenerator]
         The space generator to use.
+    special_space : Optional[Mapping[str, FnSpaceGenerator]]
+        Per-task design spaces keyed by task name, overriding `space` for
+        the tasks they name.
     sch_rules : Optional[FnScheduleRule]
         The search rules to use.
     postprocs : Optional[FnPostproc]
@@ -316,11 +320,14 @@ def tune_extracted_tasks(
     tune_contexts = []
     for i, task in enumerate(extracted_tasks):
         assert len(task.dispatched) == 1, "Only size 1 dispatched task list is supported for now"
+        task_space = space
+        if special_space is not None and task.task_name in special_space:
+            task_space = special_space[task.task_name]
         tune_contexts.append(
             TuneContext(
                 mod=default_config.mod(task.dispatched[0]),
                 target=task.target,
-                space_generator=default_config.space_generator(space),
+                space_generator=default_config.space_generator(task_space),
                 search_strategy=config.create_strategy(),
                 sch_rules=default_config.schedule_rules(sch_rules, task.target),
                 postprocs=default_config.postproc(postprocs, task.target),
@@ -360,6 +367,7 @@ def tune_tir(
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
+    special_space: Optional[Mapping[str, FnSpaceGenerator]] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
@@ -425,6 +433,7 @@ def tune_tir(
         cost_model=cost_model,
         measure_callbacks=measure_callbacks,
         space=space,
+        special_space=special_space,
         sch_rules=sch_rules,
         postprocs=postprocs,
         mutator_probs=mutator_probs,
@@ -455,6 +464,7 @@ def tune_te(
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
+    special_space: Optional[Mapping[str, FnSpaceGenerator]] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
@@ -500,6 +510,7 @@ def tune_te(
         cost_model=cost_model,
         measure_callbacks=measure_callbacks,
         space=space,
+        special_space=special_space,
         sch_rules=sch_rules,
         postprocs=postprocs,
         mutator_probs=mutator_probs,
@@ -520,6 +531,7 @@ def tune_relay(
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
+    special_space: Optional[Mapping[str, FnSpaceGenerator]] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
@@ -575,6 +587,7 @@ def tune_relay(
         cost_model=cost_model,
         measure_callbacks=measure_callbacks,
         space=space,
+        special_space=special_space,
         sch_rules=sch_rules,
         postprocs=postprocs,
         mutator_probs=mutator_probs,
@@ -600,6 +613,7 @@ def tune_relax(
     cost_model: Optional[CostModel] = None,
     measure_callbacks: Optional[List[MeasureCallback]] = None,
     space: Optional[FnSpaceGenerator] = None,
+    special_space: Optional[Mapping[str, FnSpaceGenerator]] = None,
     sch_rules: Optional[FnScheduleRule] = None,
     postprocs: Optional[FnPostproc] = None,
     mutator_probs: Optional[FnMutatorProb] = None,
@@ -653,6 +667,7 @@ def tune_relax(
         cost_model=cost_model,
         measure_callbacks=measure_callbacks,
         space=space,
+        special_space=special_space,
         sch_rules=sch_rules,
         postprocs=postprocs,
         mutator_probs=mutator_probs,
@@ -17,6 +17,7 @@
 """Function data types."""
 
 import collections
+import functools
 import inspect
 from typing import Callable, List, Mapping, Optional, Union, Tuple
 
@@ -29,6 +30,16 @@ from .buffer import Buffer
 from .expr import Var, PrimExpr
 from . import _ffi_api
 
+# Bind the frequently called packed funcs once at import time so that the
+# hot paths below skip the per-call attribute lookup on the _ffi_api module.
+_PrimFunc = _ffi_api.PrimFunc
+_Specialize = _ffi_api.Specialize
+_IndexMap = _ffi_api.IndexMap
+_IndexMapMapIndices = _ffi_api.IndexMapMapIndices
+_IndexMapMapShape = _ffi_api.IndexMapMapShape
+_IndexMapInverse = _ffi_api.IndexMapInverse
+_IndexMapNonSurjectiveInverse = _ffi_api.IndexMapNonSurjectiveInverse
+
 
 @tvm._ffi.register_object("tir.PrimFunc")
 class PrimFunc(BaseFunc):
@@ -69,22 +80,34 @@ class PrimFunc(BaseFunc):
         span=None,
     ):
 
-        param_list = []
+        params = list(params)
         buffer_map = {} if buffer_map is None else buffer_map
         preflattened_buffer_map = {} if preflattened_buffer_map is None else preflattened_buffer_map
-        for x in params:
-            x = tvm.runtime.convert(x) if not isinstance(x, Object) else x
-            if isinstance(x, Buffer):
-                var = Var(x.name, dtype="handle")
-                param_list.append(var)
-                buffer_map[var] = x
-            elif isinstance(x, Var):
-                param_list.append(x)
-            else:
-                raise TypeError("params can only contain Var or Buffer")
+
+        # Fast paths for the common homogeneous cases: the parser and the
+        # schedule machinery pass params that are either all Vars or all
+        # Buffers, for which the per-element convert/isinstance dispatch
+        # in the general loop below is pure overhead.
+        if all(type(x) is Var for x in params):  # pylint: disable=unidiomatic-typecheck
+            param_list = params
+        elif all(type(x) is Buffer for x in params):  # pylint: disable=unidiomatic-typecheck
+            param_list = [Var(x.name, dtype="handle") for x in params]
+            buffer_map.update(zip(param_list, params))
+        else:
+            param_list = []
+            for x in params:
+                x = tvm.runtime.convert(x) if not isinstance(x, Object) else x
+                if isinstance(x, Buffer):
+                    var = Var(x.name, dtype="handle")
+                    param_list.append(var)
+                    buffer_map[var] = x
+                elif isinstance(x, Var):
+                    param_list.append(x)
+                else:
+                    raise TypeError("params can only contain Var or Buffer")
 
         self.__init_handle_by_constructor__(
-            _ffi_api.PrimFunc,
+            _PrimFunc,
             param_list,
             body,
             ret_type,
@@ -173,7 +196,7 @@ class PrimFunc(BaseFunc):
         func : PrimFunc
             The new function with parameter specialized
         """
-        return _ffi_api.Specialize(self, param_map)  # type: ignore
+        return _Specialize(self, param_map)  # type: ignore
 
     def script(self, tir_prefix: str = "T", show_meta: bool = False) -> str:
         """Print IRModule into TVMScript
@@ -244,6 +267,44 @@ class TensorIntrin(Object):
         return _ffi_api.TensorIntrinGet(name)  # pylint: type: ignore
 
 
+@functools.lru_cache(maxsize=1024)
+def _classify_mapping_params(
+    mapping_function: Callable,
+) -> Tuple[Tuple[str, ...], Optional[str], Tuple[str, ...]]:
+    """Classify the parameters of an index mapping function by kind.
+
+    Returns a tuple of the positional parameter names, the name of the
+    variadic ``*args`` parameter (or None), and the keyword-only parameter
+    names.  The result only depends on the function's signature, and
+    ``inspect.signature`` is expensive, so the classification is memoized
+    for mapping functions that are applied repeatedly (e.g. layout
+    transformations inside MetaSchedule).
+    """
+    params = inspect.signature(mapping_function).parameters
+
+    arg_names = []
+    var_arg_name = None
+    kwarg_names = []
+
+    for name, param in params.items():
+        if param.kind in [
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ]:
+            arg_names.append(name)
+
+        elif param.kind == inspect.Parameter.VAR_POSITIONAL:
+            var_arg_name = name
+
+        elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+            kwarg_names.append(name)
+
+        else:
+            raise ValueError("transform_layout mapping may not have *args")
+
+    return tuple(arg_names), var_arg_name, tuple(kwarg_names)
+
+
 @tvm._ffi.register_object("tir.IndexMap")
 class IndexMap(Object):
     """A mapping from multi-dimensional indices to another set of multi-dimensional indices
@@ -265,7 +326,7 @@ class IndexMap(Object):
     AXIS_SEPARATOR = "axis_separator"
 
     def __init__(self, initial_indices, final_indices):
-        self.__init_handle_by_constructor__(_ffi_api.IndexMap, initial_indices, final_indices)
+        self.__init_handle_by_constructor__(_IndexMap, initial_indices, final_indices)
 
     @staticmethod
     def from_func(mapping_function: Callable, ndim: Optional[int] = None):
@@ -334,28 +395,13 @@ class IndexMap(Object):
             occurred.
 
         """
-        params = inspect.signature(mapping_function).parameters
-
-        args = []
-        var_arg_name = None
-        kwargs = collections.OrderedDict()
+        arg_names, var_arg_name, kwarg_names = _classify_mapping_params(mapping_function)
         default_index_dtype = "int32"
 
-        for name, param in params.items():
-            if param.kind in [
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            ]:
-                args.append(tvm.tir.Var(name, default_index_dtype))
-
-            elif param.kind == inspect.Parameter.VAR_POSITIONAL:
-                var_arg_name = name
-
-            elif param.kind == inspect.Parameter.KEYWORD_ONLY:
-                kwargs[name] = tvm.tir.Var(name, default_index_dtype)
-
-            else:
-                raise ValueError("transform_layout mapping may not have *args")
+        args = [tvm.tir.Var(name, default_index_dtype) for name in arg_names]
+        kwargs = collections.OrderedDict(
+            (name, tvm.tir.Var(name, default_index_dtype)) for name in kwarg_names
+        )
 
         # Now that all the named arguments have been collected,
         # everything that remains should go to the *args, if
@@ -372,16 +418,20 @@ class IndexMap(Object):
 
         final_indices = []
         axis_separators = []
+        # bind the sentinel and the (module-level) PrimExpr locally; the
+        # identity test is a pointer comparison, so check it first and keep
+        # attribute lookups out of the per-element loop
+        separator = IndexMap.AXIS_SEPARATOR
         for val in mapping:
-            if isinstance(val, tvm.ir.PrimExpr):
-                final_indices.append(val)
-            elif val is IndexMap.AXIS_SEPARATOR:
+            if val is separator:
                 axis_separators.append(len(final_indices))
+            elif isinstance(val, PrimExpr):
+                final_indices.append(val)
             else:
                 raise TypeError(
                     "Expected mapping function to return list of "
                     "either tvm.ir.PrimExpr or IndexMap.AXIS_SEPARATOR.  "
-                    "Instead received {val} of type {type(val)}."
+                    f"Instead received {val} of type {type(val)}."
                 )
 
         return IndexMap(initial_indices, final_indices), axis_separators
@@ -429,7 +479,7 @@ class IndexMap(Object):
         result : List[PrimExpr]
             The mapped indices
         """
-        return _ffi_api.IndexMapMapIndices(self, indices)
+        return _IndexMapMapIndices(self, indices)
 
     def map_shape(self, shape: List[PrimExpr]) -> List[PrimExpr]:
         """Apply the index map to a buffer shape
@@ -444,7 +494,7 @@ class IndexMap(Object):
         result : List[PrimExpr]
             The mapped shape
         """
-        return _ffi_api.IndexMapMapShape(self, shape)
+        return _IndexMapMapShape(self, shape)
 
     def inverse(self, shape: List[Union[Range, PrimExpr]]) -> "IndexMap":
         """Return the inverse of the map
@@ -466,8 +516,11 @@ class IndexMap(Object):
             The inverse
         """
 
-        shape = [dim if isinstance(dim, Range) else Range(0, dim) for dim in shape]
-        return _ffi_api.IndexMapInverse(self, shape)
+        # Only rebuild the list if some dimension still needs wrapping,
+        # since each Range construction is an FFI call
+        if not all(isinstance(dim, Range) for dim in shape):
+            shape = [dim if isinstance(dim, Range) else Range(0, dim) for dim in shape]
+        return _IndexMapInverse(self, shape)
 
     def non_surjective_inverse(
         self, shape: List[Union[Range, PrimExpr]]
@@ -501,5 +554,6 @@ class IndexMap(Object):
             print(predicate) # Prints "(axis0==3) && (axis2 >= 2)"
         """
 
-        shape = [dim if isinstance(dim, Range) else Range(0, dim) for dim in shape]
-        return _ffi_api.IndexMapNonSurjectiveInverse(self, shape)
+        if not all(isinstance(dim, Range) for dim in shape):
+            shape = [dim if isinstance(dim, Range) else Range(0, dim) for dim in shape]
+        return _IndexMapNonSurjectiveInverse(self, shape)
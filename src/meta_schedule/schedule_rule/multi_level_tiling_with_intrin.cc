@@ -27,10 +27,15 @@ namespace meta_schedule {
 /*!
  * \brief Tile a subset of loops in the block according to the given tensor intrinsic, and annotate
  * the tiled block for tensorization by postproc rewrite.
+ * \return The outer block to continue tiling on, or NullOpt if the block cannot be mapped onto the
+ * description of the tensor intrinsic.
  */
-tir::BlockRV TileForIntrin(tir::Schedule sch, tir::BlockRV block, const std::string& intrin_name) {
+Optional<tir::BlockRV> TileForIntrin(tir::Schedule sch, tir::BlockRV block,
+                                     const std::string& intrin_name) {
   Optional<tir::LoopRV> tiled_loop_rv = TileWithTensorIntrin(sch, block, intrin_name);
-  ICHECK(tiled_loop_rv.defined());
+  if (!tiled_loop_rv.defined()) {
+    return NullOpt;
+  }
   tir::BlockRV outer_block = sch->Blockize(tiled_loop_rv.value());
   sch->Annotate(outer_block, tir::attr::meta_schedule_auto_tensorize, String(intrin_name));
   return outer_block;
@@ -42,10 +47,15 @@ tir::BlockRV TileForIntrin(tir::Schedule sch, tir::BlockRV block, const std::str
 class MultiLevelTilingWithIntrinNode : public MultiLevelTilingNode {
  protected:
   // Override ApplySubRules to tile the inner loops according to the given tensor intrinsic, then
-  // tile the outerloops.
+  // tile the outerloops. Blocks that cannot be mapped onto the intrinsic description, e.g. because
+  // of non-divisible extents or mismatched iter types, are tiled as plain multi-level tiling
+  // instead of aborting the design space generation.
   virtual std::vector<State> ApplySubRules(std::vector<State> states) {
     states = SubRule(std::move(states), [&](State state) {
-      state.block_rv = TileForIntrin(state.sch, state.block_rv, intrin_name);
+      if (Optional<tir::BlockRV> block_rv =
+              TileForIntrin(state.sch, state.block_rv, intrin_name)) {
+        state.block_rv = block_rv.value();
+      }
       return std::vector<State>(1, state);
     });
     return MultiLevelTilingNode::ApplySubRules(states);
@@ -23,8 +23,10 @@ import pytest
 import tvm
 
 from tvm import meta_schedule as ms
-from tvm.meta_schedule import TuneConfig, tune_tir
+from tvm.meta_schedule import ExtractedTask, TuneConfig, default_config, tune_tir
 from tvm.meta_schedule.testing.custom_builder_runner import run_module_via_rpc
+from tvm.meta_schedule.testing.dummy_object import DummyBuilder, DummyRunner
+from tvm.meta_schedule.tune import tune_extracted_tasks
 from tvm.meta_schedule.testing.local_rpc import LocalRPC
 from tvm.script import tir as T
 from tvm.target import Target
@@ -95,6 +97,50 @@ def test_tune_matmul_cuda():
             print(sch.trace)
 
 
+def test_tune_tasks_special_space():
+    tasks_in_special_space = []
+    tasks_in_default_space = []
+
+    def schedule_matmul_special(sch: Schedule):
+        tasks_in_special_space.append(sch)
+        block = sch.get_block("update")
+        i, j, k = sch.get_loops(block=block)
+        sch.parallel(i)
+
+    def schedule_matmul_default(sch: Schedule):
+        tasks_in_default_space.append(sch)
+
+    mod = default_config.mod(matmul)
+    target = Target("llvm --num-cores=4")
+    tasks = [
+        ExtractedTask(task_name=task_name, mod=mod, dispatched=[mod], target=target, weight=1)
+        for task_name in ("main", "other")
+    ]
+    with tempfile.TemporaryDirectory() as work_dir:
+        tune_extracted_tasks(
+            tasks,
+            config=TuneConfig(
+                strategy="replay_trace",
+                num_trials_per_iter=4,
+                max_trials_per_task=4,
+                max_trials_global=8,
+            ),
+            work_dir=work_dir,
+            builder=DummyBuilder(),
+            runner=DummyRunner(),
+            database=ms.database.MemoryDatabase(),
+            measure_callbacks=[ms.measure_callback.AddToDatabase()],
+            space=lambda: ms.space_generator.ScheduleFn(sch_fn=schedule_matmul_default),
+            special_space={
+                "main": lambda: ms.space_generator.ScheduleFn(sch_fn=schedule_matmul_special)
+            },
+        )
+    # the task named in special_space draws its design space from the custom
+    # generator; the other task falls back to `space`
+    assert len(tasks_in_special_space) == 1
+    assert len(tasks_in_default_space) == 1
+
+
 def test_tune_run_module_via_rpc():
     target = tvm.target.Target("llvm")
     rt_mod = tvm.build(matmul, target)
@@ -140,4 +186,5 @@ def test_tune_run_module_via_rpc():
 if __name__ == """__main__""":
     test_tune_matmul_cpu()
     test_tune_matmul_cuda()
+    test_tune_tasks_special_space()
     test_tune_run_module_via_rpc()